@@ -1,9 +1,32 @@
 """Simple Flask web server for testing the Pet Adoption Center API."""
 
-from flask import Flask, request, jsonify, render_template
-from src.api.pets import create_pet, list_pets, get_pet, update_pet, delete_pet
+import hashlib
+
+from flask import Flask, Response, request, jsonify, render_template, stream_with_context
+from flask_orjson import OrjsonProvider
+from src.api.pets import (
+    create_pet,
+    create_pets_bulk,
+    list_all_pets_json,
+    stream_list_pets,
+    get_pet_json,
+    pets_version,
+    update_pet,
+    delete_pet,
+)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Pet timestamps are naive local times; emit them as-is (same as isoformat())
+# rather than letting the provider's default OPT_NAIVE_UTC mislabel them UTC.
+app.json.option = None
+
+
+def _cacheable(response, etag):
+    """Tag a GET response so clients revalidate it with If-None-Match."""
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "private, must-revalidate"
+    return response
 
 
 @app.route("/")
@@ -19,6 +42,7 @@ def api_info():
             "GET /pets": "List all pets (optional: ?species=dog&status=available)",
             "GET /pets/<id>": "Get a specific pet",
             "POST /pets": "Create a new pet",
+            "POST /pets/bulk": "Create several pets from a list",
             "PUT /pets/<id>": "Update a pet",
             "DELETE /pets/<id>": "Delete a pet",
         }
@@ -29,12 +53,29 @@ def api_info():
 def handle_list_pets():
     species = request.args.get("species")
     status = request.args.get("status")
-    return jsonify(list_pets(species=species, status=status))
+    # Read the version before building the body so a concurrent change
+    # can only make the ETag look stale, never mislabel newer data.
+    key = f"{(species or '').lower()}|{(status or '').lower()}|{pets_version()}"
+    etag = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    if request.if_none_match.contains_weak(etag):
+        return _cacheable(Response(status=304), etag)
+
+    if not (species or status):
+        body = list_all_pets_json()
+    else:
+        body = stream_with_context(stream_list_pets(species=species, status=status))
+    return _cacheable(Response(body, mimetype="application/json"), etag)
 
 
 @app.route("/pets/<int:pet_id>", methods=["GET"])
 def handle_get_pet(pet_id):
-    return jsonify(get_pet(pet_id))
+    etag = f"{pets_version()}-{pet_id}"
+    if request.if_none_match.contains_weak(etag):
+        return _cacheable(Response(status=304), etag)
+
+    return _cacheable(
+        Response(get_pet_json(pet_id), mimetype="application/json"), etag
+    )
 
 
 @app.route("/pets", methods=["POST"])
@@ -43,6 +84,12 @@ def handle_create_pet():
     return jsonify(create_pet(data))
 
 
+@app.route("/pets/bulk", methods=["POST"])
+def handle_create_pets_bulk():
+    data = request.get_json()
+    return jsonify(create_pets_bulk(data))
+
+
 @app.route("/pets/<int:pet_id>", methods=["PUT"])
 def handle_update_pet(pet_id):
     data = request.get_json()
@@ -1,4 +1,28 @@
 """Pet Adoption Center API endpoints."""
-from .pets import list_pets, get_pet, create_pet, update_pet, delete_pet
+from .pets import (
+    list_pets,
+    stream_list_pets,
+    list_all_pets_json,
+    find_pets,
+    pets_version,
+    get_pet,
+    get_pet_json,
+    create_pet,
+    create_pets_bulk,
+    update_pet,
+    delete_pet,
+)
 
-__all__ = ["list_pets", "get_pet", "create_pet", "update_pet", "delete_pet"]
+__all__ = [
+    "list_pets",
+    "stream_list_pets",
+    "list_all_pets_json",
+    "find_pets",
+    "pets_version",
+    "get_pet",
+    "get_pet_json",
+    "create_pet",
+    "create_pets_bulk",
+    "update_pet",
+    "delete_pet",
+]
@@ -3,14 +3,176 @@
 This module provides RESTful API handlers for pet operations.
 """
 
-from typing import Optional
-from src.models.pet import Pet, PetStatus, VALID_SPECIES
-from src.utils.validators import validate_required, validate_string_length
-
+import itertools
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import fields
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+
+import orjson
+
+from src.models.pet import (
+    Pet,
+    PetStatus,
+    VALID_SPECIES,
+    VALID_SPECIES_DISPLAY,
+    _STATUS_MAP,
+)
+
+# Pet fields saved by PetStore.updating so a failed update can be undone
+_PET_FIELDS = tuple(f.name for f in fields(Pet) if f.init)
+
+
+class PetStore:
+    """Thread-safe in-memory pet storage for demo purposes.
+
+    Pets are indexed by ID, bucketed by lowercase species, and their IDs
+    are indexed by status, so filtered lookups only touch matching pets.
+    A single lock guards ID assignment and every index update, and
+    every change bumps ``version`` so callers can invalidate caches.
+
+    Attributes:
+        token: Random ID for this store, so its versions never collide with
+            those of another store or process.
+        version: Counter incremented on every change to the stored pets.
+        by_id: All pets keyed by ID, in insertion order.
+        by_species: Pets keyed by ID, bucketed by lowercase species.
+        by_status: Pet IDs grouped by adoption status.
+    """
 
-# In-memory storage for demo purposes
-_pets_db: dict[int, Pet] = {}
-_next_id: int = 1
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.token = uuid.uuid4().hex
+        self.version = 0
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all pets and restart IDs at 1."""
+        self.version += 1
+        self.by_id: dict[int, Pet] = {}
+        self.by_species: dict[str, dict[int, Pet]] = {}
+        self.by_status: dict[PetStatus, set[int]] = {}
+        self._id_seq = itertools.count(1)
+
+    def get(self, pet_id: int) -> Optional[Pet]:
+        """Return the pet with the given ID, or None."""
+        return self.by_id.get(pet_id)
+
+    def add(self, pet: Pet) -> None:
+        """Assign the pet a new ID and store it."""
+        self.add_many((pet,))
+
+    def add_many(self, pets: Iterable[Pet]) -> None:
+        """Assign consecutive new IDs to the pets and store them together.
+
+        Every pet is refreshed and its index keys checked before any map
+        changes, so either all of the pets are stored or none are.
+        """
+        pets = list(pets)
+        with self._lock:
+            try:
+                for pet in pets:
+                    pet.id = next(self._id_seq)
+                    self._check_keys(pet)
+                    pet.refresh()
+                for pet in pets:
+                    self.by_id[pet.id] = pet
+                    self._index(pet)
+            finally:
+                self.version += 1
+
+    def remove(self, pet_id: int) -> Optional[Pet]:
+        """Remove and return the pet with the given ID, or None."""
+        with self._lock:
+            pet = self.by_id.pop(pet_id, None)
+            if pet is not None:
+                self._unindex(pet_id, pet._species_lc, pet.status)
+                self.version += 1
+            return pet
+
+    @contextmanager
+    def updating(self, pet: Pet) -> Iterator[Pet]:
+        """Hold the lock while a pet's fields change.
+
+        Afterwards the pet is refreshed (see ``Pet.refresh``) and re-indexed.
+        If the changes raise or cannot be refreshed, the pet's previous
+        field values are restored and the indexes are left untouched.
+        """
+        with self._lock:
+            # The pet may have been removed since the caller looked it up
+            stored = self.by_id.get(pet.id) is pet
+            old_keys = (pet._species_lc, pet.status)
+            saved = [getattr(pet, name) for name in _PET_FIELDS]
+            try:
+                yield pet
+                self._check_keys(pet)
+                pet.refresh()
+            except BaseException:
+                for name, value in zip(_PET_FIELDS, saved):
+                    setattr(pet, name, value)
+                pet.refresh()
+                raise
+            else:
+                if stored:
+                    self._reindex(pet, *old_keys)
+            finally:
+                self.version += 1
+
+    def find(self, species: Optional[str] = None, status: Optional[str] = None) -> list[Pet]:
+        """Return a snapshot of pets matching optional filters, in insertion order."""
+        with self._lock:
+            pets = self.by_species.get(species.lower(), {}) if species else self.by_id
+            if not status:
+                return list(pets.values())
+
+            ids = self.by_status.get(_STATUS_MAP.get(status.lower()), ())
+            return [p for p in pets.values() if p.id in ids]
+
+    @staticmethod
+    def _check_keys(pet: Pet) -> None:
+        """Raise ValueError if the pet's status cannot be used as an index key."""
+        if not isinstance(pet.status, PetStatus):
+            raise ValueError("Status must be a PetStatus")
+
+    def _index(self, pet: Pet) -> None:
+        """Add the pet to the species and status indexes under its current keys."""
+        self._add_to_bucket(pet)
+        self.by_status.setdefault(pet.status, set()).add(pet.id)
+
+    def _reindex(self, pet: Pet, species_lc: str, status: PetStatus) -> None:
+        """Move only the index entries whose key changed from the old keys."""
+        if pet._species_lc != species_lc:
+            self.by_species.get(species_lc, {}).pop(pet.id, None)
+            self._add_to_bucket(pet)
+        if pet.status is not status:
+            self.by_status.get(status, set()).discard(pet.id)
+            self.by_status.setdefault(pet.status, set()).add(pet.id)
+
+    def _add_to_bucket(self, pet: Pet) -> None:
+        """Add the pet to its species bucket, keeping the bucket in ID order."""
+        bucket = self.by_species.setdefault(pet._species_lc, {})
+        last_id = next(reversed(bucket), 0)
+        bucket[pet.id] = pet
+        if pet.id < last_id:
+            self.by_species[pet._species_lc] = dict(sorted(bucket.items()))
+
+    def _unindex(self, pet_id: int, species_lc: str, status: PetStatus) -> None:
+        """Remove the pet ID from the given index keys, ignoring missing entries."""
+        self.by_species.get(species_lc, {}).pop(pet_id, None)
+        self.by_status.get(status, set()).discard(pet_id)
+
+
+_store = PetStore()
+
+# Encoded unfiltered list_pets response, tagged with the store version it reflects
+_full_response_cache: Optional[tuple[str, bytes]] = None
+
+_INVALID_SPECIES_ERROR = (
+    f"Invalid species. Must be one of: {', '.join(VALID_SPECIES_DISPLAY)}"
+)
+_INVALID_STATUS_ERROR = f"Invalid status. Must be one of: {', '.join(_STATUS_MAP)}"
 
 
 def _success_response(data, message: str = "Success") -> dict:
@@ -33,6 +195,50 @@ def _error_response(code: str, message: str) -> dict:
     }
 
 
+def pets_version() -> str:
+    """Return a tag that changes whenever the stored pets change.
+
+    The tag combines the store's random token with its change counter,
+    so it stays unique across process restarts and rebuilt stores.
+
+    Returns:
+        str: Current store version, suitable for cache validators.
+    """
+    return f"{_store.token}-{_store.version}"
+
+
+@lru_cache(maxsize=64)
+def _find_pets_cached(
+    species_lc: Optional[str],
+    status_lc: Optional[str],
+    version: str,
+) -> tuple[Pet, ...]:
+    """Memoize filter results per normalized filters and store version."""
+    return tuple(_store.find(species_lc, status_lc))
+
+
+def find_pets(
+    species: Optional[str] = None,
+    status: Optional[str] = None,
+) -> tuple[Pet, ...]:
+    """Find pets matching optional filters, in insertion order.
+
+    Results are reused until the store changes.
+
+    Args:
+        species: Filter by species (optional).
+        status: Filter by adoption status (optional).
+
+    Returns:
+        tuple[Pet, ...]: Matching pets.
+    """
+    return _find_pets_cached(
+        species.lower() if species else None,
+        status.lower() if status else None,
+        pets_version(),
+    )
+
+
 def list_pets(species: Optional[str] = None, status: Optional[str] = None) -> dict:
     """List all pets with optional filtering.
 
@@ -43,13 +249,7 @@ def list_pets(species: Optional[str] = None, status: Optional[str] = None) -> di
     Returns:
         dict: Response containing list of pets.
     """
-    pets = list(_pets_db.values())
-
-    if species:
-        pets = [p for p in pets if p.species.lower() == species.lower()]
-
-    if status:
-        pets = [p for p in pets if p.status.value == status.lower()]
+    pets = find_pets(species, status)
 
     return _success_response(
         data=[p.to_dict() for p in pets],
@@ -57,6 +257,59 @@ def list_pets(species: Optional[str] = None, status: Optional[str] = None) -> di
     )
 
 
+def stream_list_pets(
+    species: Optional[str] = None,
+    status: Optional[str] = None,
+) -> Iterator[bytes]:
+    """Stream the list_pets response as JSON, one pet per chunk.
+
+    Pets are encoded as the generator is consumed, so the full list of
+    pet dicts and the response body are never held in memory at once.
+
+    Args:
+        species: Filter by species (optional).
+        status: Filter by adoption status (optional).
+
+    Yields:
+        bytes: Consecutive chunks of the JSON response body.
+    """
+    pets = find_pets(species, status)
+
+    yield b'{"success":true,"data":['
+    for i, pet in enumerate(pets):
+        chunk = pet.to_json()
+        yield b"," + chunk if i else chunk
+    yield b'],"message":' + orjson.dumps(f"Found {len(pets)} pets") + b"}"
+
+
+def list_all_pets_json() -> bytes:
+    """Return the unfiltered list_pets response as encoded JSON.
+
+    Each pet's cached JSON is embedded as-is, and the whole body is
+    cached until the store next changes, so repeated unfiltered listings
+    skip both the pet walk and the encoding.
+
+    Returns:
+        bytes: JSON response body containing every pet.
+    """
+    global _full_response_cache
+
+    # Read the version before encoding: a concurrent change makes the
+    # cached entry look stale rather than pairing new data with it.
+    version = pets_version()
+    cached = _full_response_cache
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    pets = find_pets()
+    body = orjson.dumps(_success_response(
+        data=[orjson.Fragment(p.to_json()) for p in pets],
+        message=f"Found {len(pets)} pets",
+    ))
+    _full_response_cache = (version, body)
+    return body
+
+
 def get_pet(pet_id: int) -> dict:
     """Get a specific pet by ID.
 
@@ -66,7 +319,7 @@ def get_pet(pet_id: int) -> dict:
     Returns:
         dict: Response containing pet data or error.
     """
-    pet = _pets_db.get(pet_id)
+    pet = _store.get(pet_id)
 
     if not pet:
         return _error_response("NOT_FOUND", f"Pet with ID {pet_id} not found")
@@ -74,6 +327,57 @@ def get_pet(pet_id: int) -> dict:
     return _success_response(data=pet.to_dict())
 
 
+def get_pet_json(pet_id: int) -> bytes:
+    """Get a specific pet by ID as an encoded JSON response.
+
+    Equivalent to encoding ``get_pet(pet_id)``, but the pet is encoded
+    directly from its fields rather than through ``to_dict()``.
+
+    Args:
+        pet_id: The pet's unique identifier.
+
+    Returns:
+        bytes: JSON response body containing pet data or error.
+    """
+    pet = _store.get(pet_id)
+
+    if not pet:
+        return orjson.dumps(
+            _error_response("NOT_FOUND", f"Pet with ID {pet_id} not found")
+        )
+
+    return orjson.dumps(_success_response(data=orjson.Fragment(pet.to_json())))
+
+
+def _validate_create_payload(data: dict) -> Optional[str]:
+    """Check create_pet input in a single pass over its fields.
+
+    Applies the required, name length and species checks in that order,
+    reading each field once.
+
+    Args:
+        data: Dictionary containing pet data.
+
+    Returns:
+        str: The first error message, or None if the payload is valid.
+    """
+    name = data.get("name")
+    species = data.get("species")
+
+    if name is None or (isinstance(name, str) and not name.strip()):
+        return "name is required"
+    if species is None or (isinstance(species, str) and not species.strip()):
+        return "species is required"
+    if not isinstance(name, str):
+        return "name must be a string"
+    if len(name) > 100:
+        return "name must be at most 100 characters"
+    if not isinstance(species, str) or species.lower() not in VALID_SPECIES:
+        return _INVALID_SPECIES_ERROR
+
+    return None
+
+
 def create_pet(data: dict) -> dict:
     """Create a new pet.
 
@@ -83,34 +387,13 @@ def create_pet(data: dict) -> dict:
     Returns:
         dict: Response containing created pet or error.
     """
-    global _next_id
-
-    # Validate required fields
-    name_error = validate_required(data.get("name"), "name")
-    if name_error:
-        return _error_response("VALIDATION_ERROR", name_error)
-
-    species_error = validate_required(data.get("species"), "species")
-    if species_error:
-        return _error_response("VALIDATION_ERROR", species_error)
-
-    # Validate name length
-    length_error = validate_string_length(data["name"], "name", max_length=100)
-    if length_error:
-        return _error_response("VALIDATION_ERROR", length_error)
-
-    # Validate species
-    if data["species"].lower() not in VALID_SPECIES:
-        return _error_response(
-            "VALIDATION_ERROR",
-            f"Invalid species. Must be one of: {', '.join(VALID_SPECIES)}",
-        )
+    error = _validate_create_payload(data)
+    if error:
+        return _error_response("VALIDATION_ERROR", error)
 
     try:
         pet = Pet.from_dict(data)
-        pet.id = _next_id
-        _next_id += 1
-        _pets_db[pet.id] = pet
+        _store.add(pet)
 
         return _success_response(
             data=pet.to_dict(),
@@ -120,6 +403,45 @@ def create_pet(data: dict) -> dict:
         return _error_response("VALIDATION_ERROR", str(e))
 
 
+def create_pets_bulk(data_list: list) -> dict:
+    """Create several pets at once.
+
+    Every entry is validated before any pet is stored, so either all pets
+    are created or none are.
+
+    Args:
+        data_list: List of dictionaries containing pet data.
+
+    Returns:
+        dict: Response containing the created pets or the first error.
+    """
+    if not isinstance(data_list, list):
+        return _error_response("VALIDATION_ERROR", "Expected a list of pets")
+
+    pets = []
+    for i, data in enumerate(data_list):
+        if not isinstance(data, dict):
+            return _error_response("VALIDATION_ERROR", f"Pet {i}: expected an object")
+        error = _validate_create_payload(data)
+        if error:
+            return _error_response("VALIDATION_ERROR", f"Pet {i}: {error}")
+        try:
+            pets.append(Pet.from_dict(data))
+        except ValueError as e:
+            return _error_response("VALIDATION_ERROR", f"Pet {i}: {e}")
+
+    # Encoding happens in add_many, which stores nothing if any pet fails
+    try:
+        _store.add_many(pets)
+    except ValueError as e:
+        return _error_response("VALIDATION_ERROR", str(e))
+
+    return _success_response(
+        data=[p.to_dict() for p in pets],
+        message=f"Created {len(pets)} pets",
+    )
+
+
 def update_pet(pet_id: int, data: dict) -> dict:
     """Update an existing pet.
 
@@ -130,26 +452,34 @@ def update_pet(pet_id: int, data: dict) -> dict:
     Returns:
         dict: Response containing updated pet or error.
     """
-    pet = _pets_db.get(pet_id)
+    pet = _store.get(pet_id)
 
     if not pet:
         return _error_response("NOT_FOUND", f"Pet with ID {pet_id} not found")
 
-    # Update allowed fields
-    if "name" in data:
-        pet.name = data["name"]
-    if "species" in data:
-        pet.species = data["species"]
-    if "breed" in data:
-        pet.breed = data["breed"]
-    if "age_years" in data:
-        pet.age_years = data["age_years"]
-    if "description" in data:
-        pet.description = data["description"]
     if "status" in data:
-        pet.status = PetStatus(data["status"])
+        status = data["status"]
+        status = _STATUS_MAP.get(status) if isinstance(status, str) else None
+        if status is None:
+            return _error_response("VALIDATION_ERROR", _INVALID_STATUS_ERROR)
 
     try:
+        # Update allowed fields, re-indexing the pet under its new values;
+        # fields that cannot be encoded undo the whole update
+        with _store.updating(pet):
+            if "name" in data:
+                pet.name = data["name"]
+            if "species" in data:
+                pet.species = data["species"]
+            if "breed" in data:
+                pet.breed = data["breed"]
+            if "age_years" in data:
+                pet.age_years = data["age_years"]
+            if "description" in data:
+                pet.description = data["description"]
+            if "status" in data:
+                pet.status = status
+
         pet.validate()
         return _success_response(
             data=pet.to_dict(),
@@ -168,11 +498,9 @@ def delete_pet(pet_id: int) -> dict:
     Returns:
         dict: Response confirming deletion or error.
     """
-    if pet_id not in _pets_db:
+    if _store.remove(pet_id) is None:
         return _error_response("NOT_FOUND", f"Pet with ID {pet_id} not found")
 
-    del _pets_db[pet_id]
-
     return _success_response(
         data=None,
         message=f"Pet {pet_id} deleted successfully",
@@ -1,4 +1,4 @@
 """Pet Adoption Center models."""
-from .pet import Pet, PetStatus, VALID_SPECIES
+from .pet import Pet, PetStatus, VALID_SPECIES, VALID_SPECIES_DISPLAY
 
-__all__ = ["Pet", "PetStatus", "VALID_SPECIES"]
+__all__ = ["Pet", "PetStatus", "VALID_SPECIES", "VALID_SPECIES_DISPLAY"]
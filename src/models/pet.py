@@ -8,6 +8,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+import orjson
+
 
 class PetStatus(Enum):
     """Enumeration of possible pet adoption statuses."""
@@ -17,15 +19,28 @@ class PetStatus(Enum):
     UNAVAILABLE = "unavailable"
 
 
-VALID_SPECIES = ["dog", "cat", "bird", "rabbit", "hamster", "fish", "other"]
+# Direct value -> member lookup, skipping Enum.__call__ on the hot path
+_STATUS_MAP: dict[str, PetStatus] = {s.value: s for s in PetStatus}
+
+# Ordered for display; VALID_SPECIES is the set used for membership checks
+VALID_SPECIES_DISPLAY = ("dog", "cat", "bird", "rabbit", "hamster", "fish", "other")
+VALID_SPECIES: frozenset[str] = frozenset(VALID_SPECIES_DISPLAY)
+
+_SPECIES_ERROR = f"Species must be one of: {', '.join(VALID_SPECIES_DISPLAY)}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Pet:
     """Represents a pet available for adoption.
 
+    ``to_dict()`` and ``to_json()`` return representations cached by the
+    last ``refresh()``, and the lowercase species used as PetStore's index
+    key is also derived there. Code that assigns fields directly must call
+    ``refresh()`` afterwards; pets held by PetStore must instead be
+    changed inside ``PetStore.updating``, which refreshes under its lock.
+
     Attributes:
-        id: Unique identifier for the pet.
+        id: Unique identifier for the pet (0 until the pet is stored).
         name: The pet's display name.
         species: Type of animal (dog, cat, etc.).
         breed: Specific breed (optional).
@@ -42,18 +57,51 @@ class Pet:
     """
     name: str
     species: str
-    id: Optional[int] = None
+    id: int = 0
     breed: Optional[str] = None
     age_years: Optional[float] = None
     description: Optional[str] = None
     status: PetStatus = PetStatus.AVAILABLE
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    _species_lc: str = field(init=False, repr=False, compare=False)
+    _dict_cache: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _json_cache: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
-        """Validate pet data after initialization."""
+        """Derive lookup keys and validate pet data after initialization."""
+        self._derive_keys()
         self.validate()
 
+    def refresh(self) -> None:
+        """Re-derive lookup keys and rebuild cached representations.
+
+        Call after assigning fields directly; PetStore does this for every
+        write it makes, while holding its lock. Caches are only ever
+        filled here, so a reader racing a write can never store a stale
+        or half-updated copy.
+
+        Raises:
+            ValueError: If the pet's fields cannot be encoded as JSON.
+        """
+        self._derive_keys()
+        as_dict = self._as_dict()
+        try:
+            as_json = orjson.dumps(self)
+        except orjson.JSONEncodeError as e:
+            message = f"Pet {self.name!r} cannot be encoded as JSON: {e}"
+            raise ValueError(message) from None
+        self._dict_cache, self._json_cache = as_dict, as_json
+
+    def _derive_keys(self) -> None:
+        """Derive the lowercase species used as the index key."""
+        species = self.species
+        self._species_lc = species.lower() if isinstance(species, str) else ""
+
     def validate(self) -> None:
         """Validate pet data.
 
@@ -66,30 +114,58 @@ class Pet:
         if len(self.name) > 100:
             raise ValueError("Pet name must be 100 characters or less")
 
-        if not self.species or self.species.lower() not in VALID_SPECIES:
-            raise ValueError(f"Species must be one of: {', '.join(VALID_SPECIES)}")
+        species = self.species
+        if not isinstance(species, str) or species.lower() not in VALID_SPECIES:
+            raise ValueError(_SPECIES_ERROR)
 
         if self.age_years is not None and self.age_years < 0:
             raise ValueError("Age cannot be negative")
 
+        if not isinstance(self.status, PetStatus):
+            raise ValueError("Status must be a PetStatus")
+
     def to_dict(self) -> dict:
         """Convert pet to dictionary representation.
 
+        Timestamps are left as ``datetime`` objects; the app's orjson
+        provider serializes them to ISO 8601 strings. Returns the dict
+        cached by the last ``refresh()`` if there is one, so callers must
+        not mutate it.
+
         Returns:
             dict: Pet data as a dictionary.
         """
+        cached = self._dict_cache
+        return cached if cached is not None else self._as_dict()
+
+    def _as_dict(self) -> dict:
+        """Build the dict representation, in field declaration order."""
         return {
-            "id": self.id,
             "name": self.name,
             "species": self.species,
+            "id": self.id,
             "breed": self.breed,
             "age_years": self.age_years,
             "description": self.description,
             "status": self.status.value,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
+    def to_json(self) -> bytes:
+        """Encode the pet as JSON straight from its fields.
+
+        Uses orjson's native dataclass support, so no intermediate dict is
+        built. Private (underscore) fields are not emitted, which gives the
+        same keys as ``to_dict()``, in the same (field declaration) order.
+        Returns the bytes cached by the last ``refresh()`` if there are any.
+
+        Returns:
+            bytes: Pet data as a JSON object.
+        """
+        cached = self._json_cache
+        return cached if cached is not None else orjson.dumps(self)
+
     @classmethod
     def from_dict(cls, data: dict) -> "Pet":
         """Create a Pet instance from a dictionary.
@@ -101,14 +177,17 @@ class Pet:
             Pet: New Pet instance.
 
         Raises:
-            ValueError: If required fields are missing.
+            ValueError: If required fields are missing or the status is
+                not a PetStatus or one of its values.
         """
         status = data.get("status", "available")
-        if isinstance(status, str):
-            status = PetStatus(status)
+        if not isinstance(status, PetStatus):
+            status = _STATUS_MAP.get(status) if isinstance(status, str) else None
+            if status is None:
+                raise ValueError(f"{data['status']!r} is not a valid PetStatus")
 
         return cls(
-            id=data.get("id"),
+            id=data.get("id", 0),
             name=data["name"],
             species=data["species"],
             breed=data.get("breed"),
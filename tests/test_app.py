@@ -0,0 +1,123 @@
+"""Tests for the Flask web server.
+
+Run with: pytest tests/test_app.py -v
+"""
+
+import pytest
+from datetime import datetime
+
+from app import app
+
+
+@pytest.fixture
+def client():
+    """Provide a Flask test client with an empty database."""
+    from src.api import pets
+    pets._store.clear()
+    return app.test_client()
+
+
+class TestPetRoutes:
+    """Tests for the /pets routes."""
+
+    def test_create_pet_serializes_timestamps(self, client):
+        """Test timestamps are returned as ISO 8601 strings."""
+        response = client.post("/pets", json={"name": "Buddy", "species": "dog"})
+        data = response.get_json()["data"]
+
+        assert datetime.fromisoformat(data["created_at"])
+        assert datetime.fromisoformat(data["updated_at"])
+
+    def test_list_pets_returns_json(self, client):
+        """Test list pets responds with a JSON envelope."""
+        client.post("/pets", json={"name": "Buddy", "species": "dog"})
+        response = client.get("/pets?species=dog")
+        assert response.mimetype == "application/json"
+        body = response.get_json()
+        assert body["success"] is True
+        assert body["data"][0]["name"] == "Buddy"
+
+    def test_list_pets_unfiltered(self, client):
+        """Test the unfiltered listing reflects newly created pets."""
+        assert client.get("/pets").get_json()["data"] == []
+
+        client.post("/pets", json={"name": "Buddy", "species": "dog"})
+        body = client.get("/pets").get_json()
+        assert body["message"] == "Found 1 pets"
+        assert body["data"][0]["name"] == "Buddy"
+
+    def test_get_pet_by_id(self, client):
+        """Test fetching a single pet and a missing pet."""
+        client.post("/pets", json={"name": "Buddy", "species": "dog"})
+
+        body = client.get("/pets/1").get_json()
+        assert body["success"] is True
+        assert body["data"]["name"] == "Buddy"
+
+        body = client.get("/pets/999").get_json()
+        assert body["error"]["code"] == "NOT_FOUND"
+
+    def test_create_pets_bulk(self, client):
+        """Test the bulk route creates every pet in the list."""
+        response = client.post("/pets/bulk", json=[
+            {"name": "Buddy", "species": "dog"},
+            {"name": "Whiskers", "species": "cat"},
+        ])
+        assert response.get_json()["message"] == "Created 2 pets"
+        assert len(client.get("/pets").get_json()["data"]) == 2
+
+
+class TestConditionalGet:
+    """Tests for ETag revalidation on GET routes."""
+
+    def test_get_pet_not_modified(self, client):
+        """Test a matching If-None-Match returns 304 until the pet changes."""
+        client.post("/pets", json={"name": "Buddy", "species": "dog"})
+        etag = client.get("/pets/1").headers["ETag"]
+
+        response = client.get("/pets/1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["Cache-Control"] == "private, must-revalidate"
+
+        client.put("/pets/1", json={"name": "Max"})
+        response = client.get("/pets/1", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.get_json()["data"]["name"] == "Max"
+
+    def test_list_pets_not_modified(self, client):
+        """Test list ETags depend on the filters and on store changes."""
+        client.post("/pets", json={"name": "Buddy", "species": "dog"})
+        etag = client.get("/pets?species=dog").headers["ETag"]
+
+        response = client.get("/pets?species=dog", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = client.get("/pets", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+        client.delete("/pets/1")
+        response = client.get("/pets?species=dog", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.get_json()["data"] == []
+
+    def test_etag_not_reused_by_new_store(self, client, monkeypatch):
+        """Test tags from a previous store get a full response, not a 304."""
+        from src.api import pets
+        client.post("/pets", json={"name": "Buddy", "species": "dog"})
+        pet_etag = client.get("/pets/1").headers["ETag"]
+        list_etag = client.get("/pets").headers["ETag"]
+
+        # Simulate a process restart: a fresh store reaching the same version
+        store = pets.PetStore()
+        store.version = pets._store.version - 1
+        monkeypatch.setattr(pets, "_store", store)
+        client.post("/pets", json={"name": "Rex", "species": "dog"})
+
+        response = client.get("/pets/1", headers={"If-None-Match": pet_etag})
+        assert response.status_code == 200
+        assert response.get_json()["data"]["name"] == "Rex"
+
+        response = client.get("/pets", headers={"If-None-Match": list_etag})
+        assert response.status_code == 200
+        assert response.get_json()["data"][0]["name"] == "Rex"
@@ -3,9 +3,24 @@
 Run with: pytest tests/test_pet.py -v
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import orjson
 import pytest
-from src.models.pet import Pet, PetStatus, VALID_SPECIES
-from src.api.pets import create_pet, get_pet, list_pets, update_pet, delete_pet
+from src.models.pet import Pet, PetStatus, VALID_SPECIES_DISPLAY
+from src.api.pets import (
+    create_pet,
+    create_pets_bulk,
+    find_pets,
+    get_pet,
+    get_pet_json,
+    list_pets,
+    list_all_pets_json,
+    stream_list_pets,
+    update_pet,
+    delete_pet,
+)
 
 
 class TestPetModel:
@@ -18,6 +33,12 @@ class TestPetModel:
         assert pet.species == "dog"
         assert pet.status == PetStatus.AVAILABLE
 
+    def test_create_pet_unsaved_id(self):
+        """Test a pet has id 0 and no instance __dict__ before it is stored."""
+        pet = Pet(name="Buddy", species="dog")
+        assert pet.id == 0
+        assert not hasattr(pet, "__dict__")
+
     def test_create_pet_all_fields(self):
         """Test creating a pet with all optional fields."""
         pet = Pet(
@@ -46,6 +67,13 @@ class TestPetModel:
         with pytest.raises(ValueError, match="Species must be one of"):
             Pet(name="Puff", species="dragon")
 
+    def test_validate_checks_current_species(self):
+        """Test validate checks the species assigned after construction."""
+        pet = Pet(name="Buddy", species="dog")
+        pet.species = "dragon"
+        with pytest.raises(ValueError, match="Species must be one of"):
+            pet.validate()
+
     def test_create_pet_negative_age(self):
         """Test that negative age raises ValueError."""
         with pytest.raises(ValueError, match="Age cannot be negative"):
@@ -66,6 +94,53 @@ class TestPetModel:
         assert data["species"] == "dog"
         assert data["status"] == "available"
 
+    def test_pet_to_dict_cache_refreshed(self):
+        """Test to_dict returns the dict cached by the last refresh."""
+        pet = Pet(name="Buddy", species="dog", id=1)
+        assert pet.to_dict() is not pet.to_dict()
+
+        pet.refresh()
+        data = pet.to_dict()
+        assert pet.to_dict() is data
+
+        pet.status = PetStatus.ADOPTED
+        pet.refresh()
+        assert pet.to_dict() is not data
+        assert pet.to_dict()["status"] == "adopted"
+
+    def test_pet_status_follows_status_before_refresh(self):
+        """Test to_dict and to_json agree on a status set without refresh."""
+        pet = Pet(name="Buddy", species="dog", status=PetStatus.PENDING)
+        pet.status = PetStatus.ADOPTED
+        assert pet.to_dict()["status"] == "adopted"
+        assert orjson.loads(pet.to_json())["status"] == "adopted"
+
+    def test_pet_to_json_matches_to_dict(self):
+        """Test direct JSON encoding emits the same data as to_dict."""
+        pet = Pet(name="Buddy", species="dog", id=1, breed="Labrador")
+        assert orjson.loads(pet.to_json()) == orjson.loads(orjson.dumps(pet.to_dict()))
+
+    def test_pet_to_json_key_order_matches_to_dict(self):
+        """Test every encoding path emits keys in the same order."""
+        pet = Pet(name="Buddy", species="dog", id=1)
+        assert list(orjson.loads(pet.to_json())) == list(pet.to_dict())
+
+    def test_pet_to_json_cache_refreshed(self):
+        """Test to_json returns the bytes cached by the last refresh."""
+        pet = Pet(name="Buddy", species="dog", id=1)
+        pet.refresh()
+        data = pet.to_json()
+        assert pet.to_json() is data
+
+        pet.name = "Max"
+        pet.refresh()
+        assert orjson.loads(pet.to_json())["name"] == "Max"
+
+    def test_create_pet_invalid_status_type(self):
+        """Test a status that is not a PetStatus raises ValueError."""
+        with pytest.raises(ValueError, match="Status must be a PetStatus"):
+            Pet(name="Buddy", species="dog", status="available")
+
     def test_pet_from_dict(self):
         """Test creating pet from dictionary."""
         data = {"name": "Buddy", "species": "dog", "breed": "Labrador"}
@@ -73,7 +148,7 @@ class TestPetModel:
         assert pet.name == "Buddy"
         assert pet.breed == "Labrador"
 
-    @pytest.mark.parametrize("species", VALID_SPECIES)
+    @pytest.mark.parametrize("species", VALID_SPECIES_DISPLAY)
     def test_valid_species(self, species):
         """Test all valid species are accepted."""
         pet = Pet(name="Test", species=species)
@@ -87,8 +162,30 @@ class TestPetAPI:
     def reset_db(self):
         """Reset the in-memory database before each test."""
         from src.api import pets
-        pets._pets_db.clear()
-        pets._next_id = 1
+        pets._store.clear()
+
+    @pytest.mark.parametrize("data, message", [
+        ({"name": "  ", "species": "dog"}, "name is required"),
+        ({"name": "Buddy"}, "species is required"),
+        ({"name": 42, "species": "dog"}, "name must be a string"),
+        ({"name": "A" * 101, "species": "dog"}, "name must be at most 100 characters"),
+        ({"name": "Buddy", "species": 7}, "Invalid species."),
+    ])
+    def test_create_pet_validation_errors(self, data, message):
+        """Test create pet reports the first failing check."""
+        response = create_pet(data)
+        assert response["success"] is False
+        assert response["error"]["code"] == "VALIDATION_ERROR"
+        assert response["error"]["message"].startswith(message)
+
+    def test_create_pet_invalid_species(self):
+        """Test create pet lists the valid species in display order."""
+        response = create_pet({"name": "Puff", "species": "dragon"})
+        assert response["success"] is False
+        assert response["error"]["message"] == (
+            "Invalid species. Must be one of: "
+            "dog, cat, bird, rabbit, hamster, fish, other"
+        )
 
     def test_create_pet_success(self):
         """Test successful pet creation via API."""
@@ -103,6 +200,38 @@ class TestPetAPI:
         assert response["success"] is False
         assert response["error"]["code"] == "VALIDATION_ERROR"
 
+    def test_create_pets_bulk_success(self):
+        """Test bulk creation assigns consecutive IDs in input order."""
+        create_pet({"name": "Buddy", "species": "dog"})
+        response = create_pets_bulk([
+            {"name": "Whiskers", "species": "cat"},
+            {"name": "Tweety", "species": "bird", "status": "pending"},
+        ])
+        assert response["success"] is True
+        assert [p["id"] for p in response["data"]] == [2, 3]
+        assert len(list_pets()["data"]) == 3
+
+    def test_create_pets_bulk_rejects_all_on_error(self):
+        """Test one invalid entry stores none of the batch."""
+        response = create_pets_bulk([
+            {"name": "Whiskers", "species": "cat"},
+            {"name": "Puff", "species": "dragon"},
+        ])
+        assert response["success"] is False
+        assert response["error"]["message"].startswith("Pet 1: Invalid species")
+        assert list_pets()["data"] == []
+
+    def test_create_pets_bulk_rejects_all_on_encode_error(self):
+        """Test a later entry that cannot be encoded stores none of the batch."""
+        response = create_pets_bulk([
+            {"name": "Buddy", "species": "dog"},
+            {"name": "Rex", "species": "dog", "age_years": 2**70},
+        ])
+        assert response["success"] is False
+        assert response["error"]["code"] == "VALIDATION_ERROR"
+        assert list_pets()["data"] == []
+        assert list_pets(species="dog")["data"] == []
+
     def test_get_pet_success(self):
         """Test successful pet retrieval."""
         create_pet({"name": "Buddy", "species": "dog"})
@@ -110,6 +239,14 @@ class TestPetAPI:
         assert response["success"] is True
         assert response["data"]["name"] == "Buddy"
 
+    def test_get_pet_json_matches_get_pet(self):
+        """Test the encoded response matches get_pet for found and missing pets."""
+        create_pet({"name": "Buddy", "species": "dog"})
+        for pet_id in (1, 999):
+            assert orjson.loads(get_pet_json(pet_id)) == orjson.loads(
+                orjson.dumps(get_pet(pet_id))
+            )
+
     def test_get_pet_not_found(self):
         """Test get pet returns error for non-existent ID."""
         response = get_pet(999)
@@ -132,6 +269,166 @@ class TestPetAPI:
         assert len(response["data"]) == 1
         assert response["data"][0]["species"] == "dog"
 
+    def test_list_pets_with_status_filter(self):
+        """Test list pets with species and status filters combined."""
+        create_pet({"name": "Buddy", "species": "dog"})
+        create_pet({"name": "Rex", "species": "Dog", "status": "adopted"})
+        create_pet({"name": "Whiskers", "species": "cat", "status": "adopted"})
+
+        response = list_pets(species="DOG", status="adopted")
+        assert [p["name"] for p in response["data"]] == ["Rex"]
+
+    def test_list_pets_after_update_and_delete(self):
+        """Test filters reflect updated and deleted pets."""
+        create_pet({"name": "Buddy", "species": "dog"})
+        create_pet({"name": "Whiskers", "species": "cat"})
+        update_pet(1, {"species": "cat"})
+        delete_pet(2)
+
+        assert list_pets(species="dog")["data"] == []
+        assert [p["name"] for p in list_pets(species="cat")["data"]] == ["Buddy"]
+
+    def test_add_many_stores_nothing_on_error(self):
+        """Test a batch with an unindexable pet leaves the store unchanged."""
+        from src.api import pets
+        bad = Pet(name="Rex", species="dog")
+        bad.status = "lost"
+
+        with pytest.raises(ValueError):
+            pets._store.add_many([Pet(name="Buddy", species="dog"), bad])
+
+        assert list_pets()["data"] == []
+        assert list_pets(species="dog")["data"] == []
+
+    def test_failed_update_restores_pet(self):
+        """Test an update that raises leaves the pet and indexes as they were."""
+        from src.api import pets
+        create_pet({"name": "Buddy", "species": "dog"})
+        pet = pets._store.get(1)
+
+        with pytest.raises(RuntimeError):
+            with pets._store.updating(pet):
+                pet.species = "cat"
+                raise RuntimeError
+
+        assert pet.species == "dog"
+        assert [p["name"] for p in list_pets(species="dog")["data"]] == ["Buddy"]
+        assert list_pets(species="cat")["data"] == []
+
+    def test_list_pets_keeps_order_after_update(self):
+        """Test updated pets keep their place in filtered listings."""
+        create_pet({"name": "Buddy", "species": "dog"})
+        create_pet({"name": "Rex", "species": "dog"})
+        create_pet({"name": "Whiskers", "species": "cat"})
+        update_pet(1, {"description": "Friendly", "status": "pending"})
+        update_pet(3, {"species": "dog"})
+
+        names = [p["name"] for p in list_pets(species="dog")["data"]]
+        assert names == ["Buddy", "Rex", "Whiskers"]
+
+        update_pet(3, {"species": "cat"})
+        update_pet(2, {"species": "cat"})
+        names = [p["name"] for p in list_pets(species="cat")["data"]]
+        assert names == ["Rex", "Whiskers"]
+
+    def test_list_pets_unknown_status(self):
+        """Test filtering by an unknown status returns no pets."""
+        create_pet({"name": "Buddy", "species": "dog"})
+        response = list_pets(status="lost")
+        assert response["success"] is True
+        assert response["data"] == []
+
+    def test_create_pet_concurrent_ids_unique(self):
+        """Test pets created from several threads get distinct IDs."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(
+                lambda i: create_pet({"name": f"Pet {i}", "species": "cat"}),
+                range(200),
+            ))
+
+        ids = {r["data"]["id"] for r in responses}
+        assert ids == set(range(1, 201))
+        assert len(list_pets(species="cat")["data"]) == 200
+
+    def test_find_pets_cached_until_change(self):
+        """Test filter results are reused until the store changes."""
+        create_pet({"name": "Buddy", "species": "dog"})
+        pets = find_pets(species="Dog")
+        assert find_pets(species="dog") is pets
+
+        create_pet({"name": "Rex", "species": "dog"})
+        assert [p.name for p in find_pets(species="dog")] == ["Buddy", "Rex"]
+
+    def test_stream_list_pets_matches_list_pets(self):
+        """Test the streamed body encodes the same response as list_pets."""
+        create_pet({"name": "Buddy", "species": "dog"})
+        create_pet({"name": "Whiskers", "species": "cat"})
+        create_pet({"name": "Rex", "species": "dog"})
+
+        for species in (None, "dog", "bird"):
+            body = b"".join(stream_list_pets(species=species))
+            assert orjson.loads(body) == orjson.loads(
+                orjson.dumps(list_pets(species=species))
+            )
+
+    def test_list_all_pets_json_cached_until_change(self):
+        """Test the unfiltered body is reused until the store changes."""
+        create_pet({"name": "Buddy", "species": "dog"})
+        body = list_all_pets_json()
+        assert list_all_pets_json() is body
+
+        update_pet(1, {"name": "Max"})
+        body = list_all_pets_json()
+        assert orjson.loads(body)["data"][0]["name"] == "Max"
+
+        delete_pet(1)
+        assert orjson.loads(list_all_pets_json())["data"] == []
+
+    def test_to_dict_racing_update_not_cached(self, monkeypatch):
+        """Test a dict built while an update lands is not kept as the cache."""
+        from src.api import pets
+        create_pet({"name": "Buddy", "species": "dog"})
+        pet = pets._store.get(1)
+        pet._dict_cache = None  # force the reader down the build path
+
+        build = Pet._as_dict
+        raced = []
+
+        def build_then_update(self):
+            data = build(self)
+            if not raced:
+                raced.append(True)
+                update_pet(1, {"name": "Max"})
+            return data
+
+        monkeypatch.setattr(Pet, "_as_dict", build_then_update)
+        assert pet.to_dict()["name"] == "Buddy"
+        assert get_pet(1)["data"]["name"] == "Max"
+
+    def test_to_json_racing_update_not_cached(self, monkeypatch):
+        """Test JSON encoded while an update lands is not kept as the cache."""
+        from src.api import pets
+        from src.models import pet as pet_module
+        create_pet({"name": "Buddy", "species": "dog"})
+        pet = pets._store.get(1)
+        pet._json_cache = None  # force the reader down the encode path
+
+        raced = []
+
+        def dumps_then_update(obj, *args, **kwargs):
+            data = orjson.dumps(obj, *args, **kwargs)
+            if not raced:
+                raced.append(True)
+                update_pet(1, {"name": "Max"})
+            return data
+
+        monkeypatch.setattr(
+            pet_module, "orjson", SimpleNamespace(dumps=dumps_then_update)
+        )
+        assert orjson.loads(pet.to_json())["name"] == "Buddy"
+        assert orjson.loads(get_pet_json(1))["data"]["name"] == "Max"
+        assert orjson.loads(list_all_pets_json())["data"][0]["name"] == "Max"
+
     def test_update_pet_success(self):
         """Test successful pet update."""
         create_pet({"name": "Buddy", "species": "dog"})
@@ -146,6 +443,39 @@ class TestPetAPI:
         assert response["success"] is True
         assert response["data"]["status"] == "adopted"
 
+    def test_update_pet_invalid_status(self):
+        """Test updating to an unknown status fails without changing the pet."""
+        create_pet({"name": "Buddy", "species": "dog"})
+        response = update_pet(1, {"name": "Max", "status": "lost"})
+        assert response["success"] is False
+        assert response["error"]["code"] == "VALIDATION_ERROR"
+        assert get_pet(1)["data"]["name"] == "Buddy"
+
+    def test_update_pet_encode_error_restores_pet(self):
+        """Test an update that cannot be encoded is undone."""
+        create_pet({"name": "Buddy", "species": "dog"})
+        response = update_pet(1, {"species": "cat", "age_years": 2**70})
+        assert response["error"]["code"] == "VALIDATION_ERROR"
+
+        data = get_pet(1)["data"]
+        assert (data["species"], data["age_years"]) == ("dog", None)
+        assert [p["name"] for p in list_pets(species="dog")["data"]] == ["Buddy"]
+        assert orjson.loads(get_pet_json(1))["data"]["age_years"] is None
+
+    def test_create_pet_invalid_status(self):
+        """Test create pet rejects an unknown status."""
+        response = create_pet({"name": "Buddy", "species": "dog", "status": "lost"})
+        assert response["success"] is False
+        assert response["error"]["code"] == "VALIDATION_ERROR"
+
+    @pytest.mark.parametrize("status", [None, 5, ["x"]])
+    def test_create_pet_non_string_status(self, status):
+        """Test create pet rejects a status that is not a status string."""
+        response = create_pet({"name": "Buddy", "species": "dog", "status": status})
+        assert response["success"] is False
+        assert response["error"]["code"] == "VALIDATION_ERROR"
+        assert list_pets()["data"] == []
+
     def test_delete_pet_success(self):
         """Test successful pet deletion."""
         create_pet({"name": "Buddy", "species": "dog"})